@@ -9,6 +9,8 @@ class Customization:
     """
     Base class to represent a customization.
     """
+    __slots__ = ("attribute", "operator", "value")
+
     def __init__(self, attribute: str, operator: str, value: str):
         self.attribute: str = attribute
         self.operator: str = operator
@@ -12,6 +12,8 @@ class IconCustomization(Customization):
     """
     Class to represent an icon customization.
     """
+    __slots__ = ("icon", "color", "scale", "opacity")
+
     def __init__(self, attribute: str, operator: str, value: str, icon: str, color: Tuple[int, int, int, int],
                  scale: int, opacity: int):
         super().__init__(attribute, operator, value)
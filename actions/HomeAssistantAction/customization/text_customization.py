@@ -12,6 +12,9 @@ class TextCustomization(Customization):
     """
     Class to represent a text customization.
     """
+    __slots__ = ("position", "text_attribute", "custom_text", "round", "round_precision", "text_size", "text_color",
+                 "outline_size", "outline_color", "show_unit", "line_break")
+
     def __init__(self, attribute: str, operator: str, value: str, position: str, text_attribute: str, custom_text: str,
                  do_round: bool, round_precision: int, text_size: int, text_color: Tuple[int, int, int, int],
                  outline_size: int, outline_color: Tuple[int, int, int, int], show_unit: bool, line_break: bool):
@@ -0,0 +1,50 @@
+"""
+Module for evaluating customization conditions.
+"""
+import logging
+from typing import Any
+
+
+def is_condition_met(value: Any, operator: str, custom_value: Any) -> bool:
+    """
+    Checks whether the current value fulfills the condition of a customization.
+    :param value: the current value of the attribute the customization references
+    :param operator: the operator of the condition
+    :param custom_value: the value set in the condition
+    :return: whether the condition is met
+    """
+    try:
+        # if both values are numbers, convert them both to float
+        # if one is int and one float, testing for equality might fail (21 vs 21.0 eg)
+        value = float(value)
+        custom_value = float(custom_value)
+    except (ValueError, TypeError):
+        pass
+
+    match operator:
+        case "==":
+            return str(value) == str(custom_value)
+        case "!=":
+            return str(value) != str(custom_value)
+
+    if not isinstance(value, float):
+        # other operators are only applicable to numbers
+        return False
+
+    try:
+        custom_value = float(custom_value)
+    except (ValueError, TypeError):
+        logging.error("Could not convert custom value to float: %s", custom_value)
+        return False
+
+    match operator:
+        case "<":
+            return value < custom_value
+        case "<=":
+            return value <= custom_value
+        case ">":
+            return value > custom_value
+        case ">=":
+            return value >= custom_value
+
+    return False
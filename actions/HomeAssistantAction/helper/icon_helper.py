@@ -3,13 +3,12 @@ Module for icon related operations.
 """
 
 import json
-import logging
 import os
 from typing import Dict, List
 
 from de_gensyn_HomeAssistantPlugin import const
 from de_gensyn_HomeAssistantPlugin.actions.HomeAssistantAction.customization.icon_customization import IconCustomization
-from de_gensyn_HomeAssistantPlugin.actions.HomeAssistantAction.helper import helper
+from de_gensyn_HomeAssistantPlugin.actions.HomeAssistantAction.helper import condition_helper, helper
 from de_gensyn_HomeAssistantPlugin.actions.HomeAssistantAction.settings.settings import Settings
 
 MDI_FILENAME = os.path.join(os.path.dirname(os.path.abspath(__file__)), "../../..",
@@ -57,38 +56,7 @@ def _get_icon_settings(state: Dict, settings: Settings) -> (str, str, str, str):
     for customization in customizations:
         value = get_value(state, customization)
 
-        custom_icon_value = customization.get_value()
-
-        try:
-            # if both values are numbers, convert them both to float
-            # if one is int and one float, testing for equality might fail (21 vs 21.0 eg)
-            value = float(value)
-            custom_icon_value = float(custom_icon_value)
-        except (ValueError, TypeError):
-            pass
-
-        operator = customization.get_operator()
-
-        if ((operator == "==" and str(value) == str(custom_icon_value))
-                or (operator == "!=" and str(value) != str(custom_icon_value))):
-            name, color, scale, opacity = _replace_values(name, color, scale, opacity,
-                                                          customization)
-
-        if not isinstance(value, float):
-            # other operators are only applicable to numbers
-            continue
-
-        try:
-            custom_icon_value = float(custom_icon_value)
-        except ValueError:
-            logging.error("Could not convert custom value to float: %s",
-                          custom_icon_value)
-            continue
-
-        if ((operator == "<" and value < custom_icon_value)
-                or (operator == "<=" and value <= custom_icon_value)
-                or (operator == ">" and value > custom_icon_value)
-                or (operator == ">=" and value >= custom_icon_value)):
+        if condition_helper.is_condition_met(value, customization.get_operator(), customization.get_value()):
             name, color, scale, opacity = _replace_values(name, color, scale, opacity,
                                                           customization)
 
@@ -1,11 +1,11 @@
 """
 Module for text related operations.
 """
-import logging
 from typing import Dict, List, Any
 
 from de_gensyn_HomeAssistantPlugin import const
 from de_gensyn_HomeAssistantPlugin.actions.HomeAssistantAction.customization.text_customization import TextCustomization
+from de_gensyn_HomeAssistantPlugin.actions.HomeAssistantAction.helper import condition_helper
 from de_gensyn_HomeAssistantPlugin.actions.HomeAssistantAction.settings.settings import Settings
 
 
@@ -39,40 +39,7 @@ def get_text(state: Dict, settings: Settings) -> (str, str, int, str, int, str):
     for customization in customizations:
         value = get_value(state, settings, customization)
 
-        custom_text_value = customization.get_value()
-
-        try:
-            # if both values are numbers, convert them both to float
-            # if one is int and one float, testing for equality might fail (21 vs 21.0 eg)
-            value = float(value)
-            custom_text_value = float(custom_text_value)
-        except (ValueError, TypeError):
-            pass
-
-        operator = customization.get_operator()
-
-        if ((operator == "==" and str(value) == str(custom_text_value))
-                or (operator == "!=" and str(value) != str(custom_text_value))):
-            (text, position, attribute, text_round, round_precision, text_size, text_color,
-             outline_size, outline_color, show_unit, line_break) = _replace_values(
-                text, position, attribute, text_round, round_precision, text_size, text_color,
-                outline_size, outline_color, show_unit, line_break, customization)
-
-        if not isinstance(value, float):
-            # other operators are only applicable to numbers
-            continue
-
-        try:
-            custom_text_value = float(custom_text_value)
-        except ValueError:
-            logging.error("Could not convert custom value to float: %s",
-                          custom_text_value)
-            continue
-
-        if ((operator == "<" and value < custom_text_value)
-                or (operator == "<=" and value <= custom_text_value)
-                or (operator == ">" and value > custom_text_value)
-                or (operator == ">=" and value >= custom_text_value)):
+        if condition_helper.is_condition_met(value, customization.get_operator(), customization.get_value()):
             (text, position, attribute, text_round, round_precision, text_size, text_color,
              outline_size, outline_color, show_unit, line_break) = _replace_values(
                 text, position, attribute, text_round, round_precision, text_size, text_color,
@@ -93,20 +60,17 @@ def get_value(state: Dict, settings: Settings, customization: TextCustomization)
     """
     Gets the current value that the customization references.
     """
-    attribute = settings.get_text_attribute()
-    text_round = settings.get_text_round()
-    round_precision = settings.get_text_round_precision()
-    show_unit = settings.get_text_show_unit()
-
-    # get text without line break to calculate the correct length
-    text = _get_text(state, attribute, text_round, round_precision, show_unit, False)
+    customization_attribute = customization.get_attribute()
 
-    if customization.get_attribute() == const.STATE:
+    if customization_attribute == const.STATE:
         value = state[const.STATE]
-    elif customization.get_attribute() == const.CUSTOM_TEXT_TEXT_LENGTH:
+    elif customization_attribute == const.CUSTOM_TEXT_TEXT_LENGTH:
+        # get text without line break to calculate the correct length
+        text = _get_text(state, settings.get_text_attribute(), settings.get_text_round(),
+                         settings.get_text_round_precision(), settings.get_text_show_unit(), False)
         value = len(text)
     else:
-        value = state[const.ATTRIBUTES].get(customization.get_attribute())
+        value = state[const.ATTRIBUTES].get(customization_attribute)
 
     return value
 
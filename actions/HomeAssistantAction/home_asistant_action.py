@@ -9,6 +9,7 @@ from typing import List, Tuple
 
 import gi
 gi.require_version("Adw", "1")
+from gi.repository import GLib
 from gi.repository.Gtk import Button, Align, Widget
 from gi.repository.Adw import PreferencesGroup
 
@@ -36,6 +37,13 @@ from de_gensyn_HomeAssistantPlugin.actions.HomeAssistantAction.service_parameter
 from de_gensyn_HomeAssistantPlugin.actions.HomeAssistantAction.settings.settings import Settings
 from src.backend.PluginManager.ActionBase import ActionBase
 
+RELOAD_DEBOUNCE_MS = 100
+
+CUSTOMIZATION_WINDOWS = {
+    const.CUSTOMIZATION_TYPE_ICON: CustomizationIconWindow,
+    const.CUSTOMIZATION_TYPE_TEXT: CustomizationTextWindow
+}
+
 
 class HomeAssistantAction(ActionBase):
     """
@@ -56,6 +64,7 @@ class HomeAssistantAction(ActionBase):
         # self.add_event_assigner(event_assigner)
 
         self.initialized = False
+        self._reload_source_id = None
         self.lm = self.plugin_base.locale_manager
 
         self._init_entity_group()
@@ -96,6 +105,8 @@ class HomeAssistantAction(ActionBase):
         """
         Clean up after action was removed.
         """
+        self._cancel_pending_reload()
+
         self.plugin_base.backend.remove_action(self.on_ready)
         self.plugin_base.backend.remove_tracked_entity(
             self.settings.get_entity(),
@@ -116,16 +127,18 @@ class HomeAssistantAction(ActionBase):
         parameters = {}
 
         for parameter, value in self.settings.get_service_parameters().items():
-            try:
-                # try to create a dict or list from the value
-                value = json.loads(value)
-            except (JSONDecodeError, TypeError):
-                # if it doesn't work just keep it as is
-                pass
+            if isinstance(value, str):
+                # only text entries can hold a dict or list; numbers and booleans are kept as they are
+                try:
+                    value = json.loads(value)
+                except JSONDecodeError:
+                    # if it doesn't work just keep it as is
+                    pass
 
             parameters[parameter] = value
 
-        self.plugin_base.backend.call_service(entity, service, parameters)
+        # don't block the key handler while waiting for Home Assistant to respond
+        self.plugin_base.backend.queue_service_call(entity, service, parameters)
 
     def get_config_rows(self) -> list:
         """
@@ -205,7 +218,7 @@ class HomeAssistantAction(ActionBase):
         #
         self.icon_scale: ScaleRow = ScaleRow(self, const.SETTING_ICON_SCALE, const.DEFAULT_ICON_SCALE,
                                              const.ICON_MIN_SCALE, const.ICON_MAX_SCALE, title=const.LABEL_ICON_SCALE,
-                                             step=1, digits=0, on_change=self._reload, can_reset=False,
+                                             step=1, digits=0, on_change=self._reload_debounced, can_reset=False,
                                              complex_var_name=True)
 
         #
@@ -213,8 +226,9 @@ class HomeAssistantAction(ActionBase):
         #
         self.icon_opacity: ScaleRow = ScaleRow(self, const.SETTING_ICON_OPACITY, const.DEFAULT_ICON_OPACITY,
                                                const.ICON_MIN_OPACITY, const.ICON_MAX_OPACITY,
-                                               title=const.LABEL_ICON_OPACITY, step=1, digits=0, on_change=self._reload,
-                                               can_reset=False, complex_var_name=True)
+                                               title=const.LABEL_ICON_OPACITY, step=1, digits=0,
+                                               on_change=self._reload_debounced, can_reset=False,
+                                               complex_var_name=True)
 
         #
         # Icon custom icon
@@ -229,6 +243,11 @@ class HomeAssistantAction(ActionBase):
                                                                   title=const.LABEL_ICON_CUSTOM_ICON, can_reset=False,
                                                                   auto_add=False)
         self.icon_custom_icon_expander.widget.add_suffix(icon_custom_icon_add)
+        # The expander is unmapped whenever it can't be seen: while the configuration panel is closed and
+        # while "show icon" is collapsed (Adw.ExpanderRow hides its rows in a Gtk.Revealer, which makes
+        # its child invisible once it is fully collapsed). GTK emits "map" on every transition back to
+        # visible, so rows skipped in _load_custom_icons are always rebuilt before they are shown.
+        self.icon_custom_icon_expander.widget.connect(const.CONNECT_MAP, self._on_map_custom_icons)
 
         self.icon_show_icon.add_row(self.icon_icon.widget)
         self.icon_show_icon.add_row(self.icon_color.widget)
@@ -280,7 +299,8 @@ class HomeAssistantAction(ActionBase):
                                                        const.DEFAULT_TEXT_ROUND_PRECISION,
                                                        const.TEXT_ROUND_MIN_PRECISION, const.TEXT_ROUND_MAX_PRECISION,
                                                        title=const.LABEL_TEXT_ROUND, step=1, digits=0,
-                                                       on_change=self._reload, can_reset=False, complex_var_name=True)
+                                                       on_change=self._reload_debounced, can_reset=False,
+                                                       complex_var_name=True)
 
         self.text_round.add_row(self.text_round_precision.widget)
 
@@ -290,7 +310,8 @@ class HomeAssistantAction(ActionBase):
         self.text_text_size: ScaleRow = ScaleRow(self, const.SETTING_TEXT_TEXT_SIZE, const.DEFAULT_TEXT_TEXT_SIZE,
                                                  const.TEXT_TEXT_MIN_SIZE, const.TEXT_TEXT_MAX_SIZE,
                                                  title=const.LABEL_TEXT_TEXT_SIZE, step=1, digits=0,
-                                                 on_change=self._reload, can_reset=False, complex_var_name=True)
+                                                 on_change=self._reload_debounced, can_reset=False,
+                                                 complex_var_name=True)
 
         #
         # Text color
@@ -306,7 +327,7 @@ class HomeAssistantAction(ActionBase):
         self.text_outline_size: ScaleRow = ScaleRow(self, const.SETTING_TEXT_OUTLINE_SIZE,
                                                     const.DEFAULT_TEXT_OUTLINE_SIZE, const.TEXT_OUTLINE_MIN_SIZE,
                                                     const.TEXT_OUTLINE_MAX_SIZE, title=const.LABEL_TEXT_OUTLINE_SIZE,
-                                                    step=1, digits=0, on_change=self._reload, can_reset=False,
+                                                    step=1, digits=0, on_change=self._reload_debounced, can_reset=False,
                                                     complex_var_name=True)
 
         #
@@ -346,6 +367,8 @@ class HomeAssistantAction(ActionBase):
                                                                   title=const.LABEL_TEXT_CUSTOM_TEXT, can_reset=False,
                                                                   auto_add=False)
         self.text_custom_text_expander.widget.add_suffix(text_custom_text_add)
+        # see _init_icon_group on why the "map" signal is sufficient
+        self.text_custom_text_expander.widget.connect(const.CONNECT_MAP, self._on_map_custom_text)
 
         self.text_show_text.add_row(self.text_position_combo.widget)
         self.text_show_text.add_row(self.text_attribute_combo.widget)
@@ -454,6 +477,24 @@ class HomeAssistantAction(ActionBase):
         self._set_enabled_disabled()
         self._entity_updated()
 
+    def _reload_debounced(self, *_):
+        """
+        Coalesce rapid changes (e.g. dragging a scale) into a single reload that runs once no
+        further change happened for RELOAD_DEBOUNCE_MS.
+        """
+        self._cancel_pending_reload()
+        self._reload_source_id = GLib.timeout_add(RELOAD_DEBOUNCE_MS, self._flush_reload)
+
+    def _cancel_pending_reload(self) -> None:
+        if self._reload_source_id is not None:
+            GLib.source_remove(self._reload_source_id)
+            self._reload_source_id = None
+
+    def _flush_reload(self) -> bool:
+        self._reload_source_id = None
+        self._reload()
+        return False
+
     def _on_change_domain(self, _, domain, old_domain):
         """
         Execute when the domain is changed.
@@ -642,7 +683,19 @@ class HomeAssistantAction(ActionBase):
         if Counter(attribute_model) != Counter(self._get_current_attributes()):
             self.text_attribute_combo.populate(attribute_model, attribute, trigger_callback=False)
 
+    def _on_map_custom_icons(self, _) -> None:
+        """
+        Build the icon customization rows once they become visible.
+        """
+        if self.initialized:
+            self._load_custom_icons()
+
     def _load_custom_icons(self):
+        if not self.icon_custom_icon_expander.widget.get_mapped():
+            # rows are not visible - they are built when the expander is shown; if the panel is open
+            # (e.g. on_ready running again after a reconnect) the expander is mapped and we rebuild here
+            return
+
         self.icon_custom_icon_expander.clear_rows()
 
         attributes = self._get_current_attributes()
@@ -661,15 +714,26 @@ class HomeAssistantAction(ActionBase):
             row.delete_button.connect(const.CONNECT_CLICKED, self._on_delete_customization,
                                       const.CUSTOMIZATION_TYPE_ICON, index)
 
-            row.up_button.connect(const.CONNECT_CLICKED, self._on_move_up,
-                                  const.CUSTOMIZATION_TYPE_ICON, index)
+            row.up_button.connect(const.CONNECT_CLICKED, self._on_move,
+                                  const.CUSTOMIZATION_TYPE_ICON, index, -1)
 
-            row.down_button.connect(const.CONNECT_CLICKED, self._on_move_down,
-                                    const.CUSTOMIZATION_TYPE_ICON, index)
+            row.down_button.connect(const.CONNECT_CLICKED, self._on_move,
+                                    const.CUSTOMIZATION_TYPE_ICON, index, 1)
 
             self.icon_custom_icon_expander.add_row(row)
 
+    def _on_map_custom_text(self, _) -> None:
+        """
+        Build the text customization rows once they become visible.
+        """
+        if self.initialized:
+            self._load_custom_text()
+
     def _load_custom_text(self):
+        if not self.text_custom_text_expander.widget.get_mapped():
+            # rows are not visible - they are built when the expander is shown
+            return
+
         self.text_custom_text_expander.clear_rows()
 
         attributes = self._get_current_attributes()
@@ -683,14 +747,19 @@ class HomeAssistantAction(ActionBase):
 
             row.delete_button.connect(const.CONNECT_CLICKED, self._on_delete_customization, const.CUSTOMIZATION_TYPE_TEXT, index)
 
-            row.up_button.connect(const.CONNECT_CLICKED, self._on_move_up, const.CUSTOMIZATION_TYPE_TEXT, index)
+            row.up_button.connect(const.CONNECT_CLICKED, self._on_move, const.CUSTOMIZATION_TYPE_TEXT, index, -1)
 
-            row.down_button.connect(const.CONNECT_CLICKED, self._on_move_down, const.CUSTOMIZATION_TYPE_TEXT, index)
+            row.down_button.connect(const.CONNECT_CLICKED, self._on_move, const.CUSTOMIZATION_TYPE_TEXT, index, 1)
 
             self.text_custom_text_expander.add_row(row)
 
     def _on_add_customization(self, _, customization_type: str, callback,
                               index: int = -1):
+        window_class = CUSTOMIZATION_WINDOWS.get(customization_type)
+
+        if window_class is None:
+            raise ValueError(f"Unknown customization type: {customization_type}")
+
         attributes = self._get_current_attributes()
 
         current = None
@@ -701,15 +770,7 @@ class HomeAssistantAction(ActionBase):
             else:
                 current = self.settings.get_text_customizations()[index]
 
-        if customization_type == const.CUSTOMIZATION_TYPE_ICON:
-            window = CustomizationIconWindow(self.lm, attributes, callback, current=current,
-                                             index=index)
-        elif customization_type == const.CUSTOMIZATION_TYPE_TEXT:
-            window = CustomizationTextWindow(self.lm, attributes, callback, current=current,
-                                             index=index)
-        else:
-            raise ValueError(f"Unknown customization type: {customization_type}")
-
+        window = window_class(self.lm, attributes, callback, current=current, index=index)
         window.show()
 
     def _on_delete_customization(self, _, customization_type: str, index: int):
@@ -723,22 +784,11 @@ class HomeAssistantAction(ActionBase):
 
         self._entity_updated()
 
-    def _on_move_up(self, _, customization_type: str, index: int):
-        if customization_type == const.CUSTOMIZATION_TYPE_ICON:
-            self.settings.move_icon_customization(index, -1)
-        else:
-            self.settings.move_text_customization(index, -1)
-
-        self._load_custom_icons()
-        self._load_custom_text()
-
-        self._entity_updated()
-
-    def _on_move_down(self, _, customization_type: str, index: int):
+    def _on_move(self, _, customization_type: str, index: int, places_count: int):
         if customization_type == const.CUSTOMIZATION_TYPE_ICON:
-            self.settings.move_icon_customization(index, 1)
+            self.settings.move_icon_customization(index, places_count)
         else:
-            self.settings.move_text_customization(index, 1)
+            self.settings.move_text_customization(index, places_count)
 
         self._load_custom_icons()
         self._load_custom_text()
@@ -14,7 +14,7 @@ class ParameterScaleRow(ParameterRow, ScaleRow):
     def __init__(self, action_core, var_name: str, field_name: str, default_value: bool, min_value, max_value, step):
         digits = 0
         if "." in str(step):
-            digits = len(str(step).split(".")[1])
+            digits = len(str(step).partition(".")[2])
 
         ParameterRow.__init__(self, action_core, field_name)
         ScaleRow.__init__(self, action_core, var_name, default_value, title=field_name, min=min_value, max=max_value,
@@ -19,9 +19,16 @@ class Settings:
     def __init__(self, action):
         self.action = action
 
-        settings = settings_helper.migrate(self.action.get_settings())
+        existing = self.action.get_settings()
+
+        settings = settings_helper.migrate(existing)
         settings = settings_helper.get_action_settings(settings)
 
+        if settings == existing:
+            # nothing was migrated or added - no need to write the settings to the disk again
+            self.settings = existing
+            return
+
         self.settings = settings
         self.action.set_settings(self.settings)
 
@@ -74,7 +81,12 @@ class Settings:
         :param field: the field to set
         :param value: the value for the field
         """
-        self.settings[const.SETTING_SERVICE][const.SETTING_PARAMETERS][field] = value
+        parameters = self.settings[const.SETTING_SERVICE][const.SETTING_PARAMETERS]
+
+        if field in parameters and parameters[field] == value:
+            return
+
+        parameters[field] = value
         self.action.set_settings(self.settings)
 
     def remove_service_parameter(self, field) -> None:
@@ -82,13 +94,21 @@ class Settings:
         Remove the service parameter for the field.
         :param field: the field to remove
         """
-        self.settings[const.SETTING_SERVICE][const.SETTING_PARAMETERS].pop(field)
+        parameters = self.settings[const.SETTING_SERVICE][const.SETTING_PARAMETERS]
+
+        if field not in parameters:
+            return
+
+        parameters.pop(field)
         self.action.set_settings(self.settings)
 
     def clear_service_parameters(self) -> None:
         """
         Clear all service parameters.
         """
+        if not self.settings[const.SETTING_SERVICE][const.SETTING_PARAMETERS]:
+            return
+
         self.settings[const.SETTING_SERVICE][const.SETTING_PARAMETERS] = {}
         self.action.set_settings(self.settings)
 
@@ -190,56 +190,44 @@ def migrate_v0_to_v1(settings: Dict[str, Any]) -> Dict[str, Any]:
                                                               customization[const.CUSTOM_TEXT_OUTLINE_COLOR]]
             customization[const.CUSTOM_TEXT_OUTLINE_COLOR].append(255)
 
-    # migrate entity settings
-    settings[const.SETTING_ENTITY] = {}
-    settings[const.SETTING_ENTITY][const.SETTING_DOMAIN] = settings.get(const.SETTING_ENTITY_DOMAIN, const.EMPTY_STRING)
-    settings[const.SETTING_ENTITY][const.SETTING_ENTITY] = settings.get(const.SETTING_ENTITY_ENTITY, const.EMPTY_STRING)
-
-    # migrate service settings
-    settings[const.SETTING_SERVICE] = {}
-    settings[const.SETTING_SERVICE][const.SETTING_CALL_SERVICE] = settings.get(const.SETTING_SERVICE_CALL_SERVICE,
-                                                                               const.DEFAULT_SERVICE_CALL_SERVICE)
-    settings[const.SETTING_SERVICE][const.SETTING_SERVICE] = settings.get(const.SETTING_SERVICE_SERVICE,
-                                                                          const.EMPTY_STRING)
-    settings[const.SETTING_SERVICE][const.SETTING_PARAMETERS] = {}
-    for key, value in settings.get("service.service_parameters", {}).items():
-        settings[const.SETTING_SERVICE][const.SETTING_PARAMETERS][key] = value
-
-    # migrate icon settings
-    settings[const.SETTING_ICON] = {}
-    settings[const.SETTING_ICON][const.SETTING_SHOW_ICON] = settings.get(const.SETTING_ICON_SHOW_ICON,
-                                                                         const.DEFAULT_ICON_SHOW_ICON)
-    settings[const.SETTING_ICON][const.SETTING_ICON] = settings.get(const.SETTING_ICON_ICON, const.EMPTY_STRING)
-    settings[const.SETTING_ICON][const.SETTING_COLOR] = settings.get(const.SETTING_ICON_COLOR, const.DEFAULT_ICON_COLOR)
-    settings[const.SETTING_ICON][const.SETTING_SCALE] = settings.get(const.SETTING_ICON_SCALE, const.DEFAULT_ICON_SCALE)
-    settings[const.SETTING_ICON][const.SETTING_OPACITY] = settings.get(const.SETTING_ICON_OPACITY,
-                                                                       const.DEFAULT_ICON_OPACITY)
-    settings[const.SETTING_ICON][const.SETTING_CUSTOMIZATIONS] = settings.get(const.SETTING_CUSTOMIZATION_ICON, [])
-
-    # migrate text settings
-    settings[const.SETTING_TEXT] = {}
-    settings[const.SETTING_TEXT][const.SETTING_SHOW_TEXT] = settings.get(const.SETTING_TEXT_SHOW_TEXT,
-                                                                         const.DEFAULT_TEXT_SHOW_TEXT)
-    settings[const.SETTING_TEXT][const.SETTING_POSITION] = settings.get(const.SETTING_TEXT_POSITION,
-                                                                        const.DEFAULT_TEXT_POSITION)
-    settings[const.SETTING_TEXT][const.SETTING_ATTRIBUTE] = settings.get(const.SETTING_TEXT_ATTRIBUTE,
-                                                                         const.DEFAULT_TEXT_ATTRIBUTE)
-    settings[const.SETTING_TEXT][const.SETTING_ROUND] = settings.get(const.SETTING_TEXT_ROUND, const.DEFAULT_TEXT_ROUND)
-    settings[const.SETTING_TEXT][const.SETTING_ROUND_PRECISION] = settings.get(const.SETTING_TEXT_ROUND_PRECISION,
-                                                                               const.DEFAULT_TEXT_ROUND_PRECISION)
-    settings[const.SETTING_TEXT][const.SETTING_TEXT_SIZE] = settings.get(const.SETTING_TEXT_TEXT_SIZE,
-                                                                         const.DEFAULT_TEXT_TEXT_SIZE)
-    settings[const.SETTING_TEXT][const.SETTING_TEXT_COLOR] = settings.get(const.SETTING_TEXT_TEXT_COLOR,
-                                                                          const.DEFAULT_TEXT_TEXT_COLOR)
-    settings[const.SETTING_TEXT][const.SETTING_OUTLINE_SIZE] = settings.get(const.SETTING_TEXT_OUTLINE_SIZE,
-                                                                            const.DEFAULT_TEXT_OUTLINE_SIZE)
-    settings[const.SETTING_TEXT][const.SETTING_OUTLINE_COLOR] = settings.get(const.SETTING_TEXT_OUTLINE_COLOR,
-                                                                             const.DEFAULT_TEXT_OUTLINE_COLOR)
-    settings[const.SETTING_TEXT][const.SETTING_SHOW_UNIT] = settings.get(const.SETTING_TEXT_SHOW_UNIT,
-                                                                         const.DEFAULT_TEXT_SHOW_UNIT)
-    settings[const.SETTING_TEXT][const.SETTING_UNIT_LINE_BREAK] = settings.get(const.SETTING_TEXT_UNIT_LINE_BREAK,
-                                                                               const.DEFAULT_TEXT_UNIT_LINE_BREAK)
-    settings[const.SETTING_TEXT][const.SETTING_CUSTOMIZATIONS] = settings.get(const.SETTING_CUSTOMIZATION_TEXT, [])
+    # move entity, service, icon and text settings to their new sections
+    settings.update({
+        const.SETTING_ENTITY: {
+            const.SETTING_DOMAIN: settings.get(const.SETTING_ENTITY_DOMAIN, const.EMPTY_STRING),
+            const.SETTING_ENTITY: settings.get(const.SETTING_ENTITY_ENTITY, const.EMPTY_STRING)
+        },
+        const.SETTING_SERVICE: {
+            const.SETTING_CALL_SERVICE: settings.get(const.SETTING_SERVICE_CALL_SERVICE,
+                                                     const.DEFAULT_SERVICE_CALL_SERVICE),
+            const.SETTING_SERVICE: settings.get(const.SETTING_SERVICE_SERVICE, const.EMPTY_STRING),
+            const.SETTING_PARAMETERS: dict(settings.get("service.service_parameters", {}))
+        },
+        const.SETTING_ICON: {
+            const.SETTING_SHOW_ICON: settings.get(const.SETTING_ICON_SHOW_ICON, const.DEFAULT_ICON_SHOW_ICON),
+            const.SETTING_ICON: settings.get(const.SETTING_ICON_ICON, const.EMPTY_STRING),
+            const.SETTING_COLOR: settings.get(const.SETTING_ICON_COLOR, const.DEFAULT_ICON_COLOR),
+            const.SETTING_SCALE: settings.get(const.SETTING_ICON_SCALE, const.DEFAULT_ICON_SCALE),
+            const.SETTING_OPACITY: settings.get(const.SETTING_ICON_OPACITY, const.DEFAULT_ICON_OPACITY),
+            const.SETTING_CUSTOMIZATIONS: settings.get(const.SETTING_CUSTOMIZATION_ICON, [])
+        },
+        const.SETTING_TEXT: {
+            const.SETTING_SHOW_TEXT: settings.get(const.SETTING_TEXT_SHOW_TEXT, const.DEFAULT_TEXT_SHOW_TEXT),
+            const.SETTING_POSITION: settings.get(const.SETTING_TEXT_POSITION, const.DEFAULT_TEXT_POSITION),
+            const.SETTING_ATTRIBUTE: settings.get(const.SETTING_TEXT_ATTRIBUTE, const.DEFAULT_TEXT_ATTRIBUTE),
+            const.SETTING_ROUND: settings.get(const.SETTING_TEXT_ROUND, const.DEFAULT_TEXT_ROUND),
+            const.SETTING_ROUND_PRECISION: settings.get(const.SETTING_TEXT_ROUND_PRECISION,
+                                                        const.DEFAULT_TEXT_ROUND_PRECISION),
+            const.SETTING_TEXT_SIZE: settings.get(const.SETTING_TEXT_TEXT_SIZE, const.DEFAULT_TEXT_TEXT_SIZE),
+            const.SETTING_TEXT_COLOR: settings.get(const.SETTING_TEXT_TEXT_COLOR, const.DEFAULT_TEXT_TEXT_COLOR),
+            const.SETTING_OUTLINE_SIZE: settings.get(const.SETTING_TEXT_OUTLINE_SIZE, const.DEFAULT_TEXT_OUTLINE_SIZE),
+            const.SETTING_OUTLINE_COLOR: settings.get(const.SETTING_TEXT_OUTLINE_COLOR,
+                                                      const.DEFAULT_TEXT_OUTLINE_COLOR),
+            const.SETTING_SHOW_UNIT: settings.get(const.SETTING_TEXT_SHOW_UNIT, const.DEFAULT_TEXT_SHOW_UNIT),
+            const.SETTING_UNIT_LINE_BREAK: settings.get(const.SETTING_TEXT_UNIT_LINE_BREAK,
+                                                        const.DEFAULT_TEXT_UNIT_LINE_BREAK),
+            const.SETTING_CUSTOMIZATIONS: settings.get(const.SETTING_CUSTOMIZATION_TEXT, [])
+        }
+    })
 
     return settings
 
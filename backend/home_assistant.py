@@ -3,6 +3,7 @@ Module for the Home Assistant backend.
 """
 
 import json
+from queue import Queue
 from ssl import CERT_NONE, SSLError, SSLEOFError
 from threading import Thread, Semaphore
 from time import sleep
@@ -23,6 +24,13 @@ ID = "id"
 FIELD_TYPE = "type"
 FIELD_SUCCESS = "success"
 FIELD_RESULT = "result"
+FIELD_VARIABLES = "variables"
+FIELD_TRIGGER = "trigger"
+FIELD_TO_STATE = "to_state"
+FIELD_FROM_STATE = "from_state"
+
+KEYS = "keys"
+SUBSCRIPTION_ID = "subscription_id"
 
 BUTTON_ENCODE_SYMBOL = "-"
 
@@ -56,6 +64,10 @@ class HomeAssistantBackend:
     _entities_update_semaphore = Semaphore(1)
     _websocket_semaphore = Semaphore(1)
     _tracked_entities: Dict[str, Set[Callable]] = {}
+    # queued service calls are executed one after another by a single worker thread; this only
+    # serializes service calls - other callers of _connect() may still run concurrently
+    _service_call_queue: Queue = Queue()
+    _service_call_thread: Thread = None
 
     def set_host(self, host: str) -> None:
         """
@@ -262,14 +274,12 @@ class HomeAssistantBackend:
             return None
         except ConnectionRefusedError:
             log.error(
-                f'Connection refused by {websocket_host}. Make sure'
-                f" 'websocket_api' is enabled in your Home Assistant configuration."
+                "Connection refused by {}. Make sure 'websocket_api' is enabled in your Home Assistant "
+                "configuration.", websocket_host
             )
             return None
         except ERRORS_TO_EXCEPT as e:
-            log.error(
-                f"Could not connect to {websocket_host}: {e}"
-            )
+            log.error("Could not connect to {}: {}", websocket_host, e)
             return None
 
         return new_websocket
@@ -283,11 +293,11 @@ class HomeAssistantBackend:
             # if the connection was lost we might need to resubscribe to entity events
             for domain, domain_entry in self._entities.items():
                 for entity, entity_settings in domain_entry.items():
-                    if entity_settings.get("keys"):
-                        action_items = entity_settings["keys"].items()
+                    if entity_settings.get(KEYS):
+                        action_items = entity_settings[KEYS].items()
 
-                        entity_settings["subscription_id"] = -1
-                        entity_settings["keys"] = {}
+                        entity_settings[SUBSCRIPTION_ID] = -1
+                        entity_settings[KEYS] = {}
 
                         for action_uid, action in action_items:
                             self.add_tracked_entity(entity, action_uid, action)
@@ -296,46 +306,43 @@ class HomeAssistantBackend:
             try:
                 message = self._changes_websocket.recv()
             except ERRORS_TO_EXCEPT as e:
-                log.info(f"Connection closed; quitting recv() loop: {e}")
+                log.info("Connection closed; quitting recv() loop: {}", e)
                 break
 
             if not message:
                 # received an empty message - happens when Home Assistants shuts down; ignore
                 continue
 
-            message_type = _get_field_from_message(message, FIELD_TYPE)
+            # parse the message only once; events are by far the most frequent messages
+            parsed = _parse_message(message)
 
-            if FIELD_EVENT == message_type:
-                new_state = (
-                    json.loads(message).get(FIELD_EVENT, {}).get("variables", {}).get("trigger",
-                                                                                      {}).get(
-                        "to_state", {})
-                )
+            if FIELD_EVENT == parsed.get(FIELD_TYPE):
+                trigger = parsed.get(FIELD_EVENT, {}).get(FIELD_VARIABLES, {}).get(FIELD_TRIGGER, {})
+                new_state = trigger.get(FIELD_TO_STATE, {})
 
                 if not new_state:
                     # this can happen if the entity was removed from HA
-                    entity_id = json.loads(message).get(FIELD_EVENT, {}).get("variables", {}).get(
-                        "trigger", {}).get("from_state", {}).get(ENTITY_ID)
-                    entity_settings = self._entities[entity_id.split(".")[0]].get(entity_id)
-                    actions = entity_settings.get("keys").values()
+                    entity_id = trigger.get(FIELD_FROM_STATE, {}).get(ENTITY_ID)
+                    entity_settings = self._entities[entity_id.partition(".")[0]].get(entity_id)
+                    actions = entity_settings.get(KEYS).values()
                     for action_entity_updated in actions:
                         action_entity_updated()
                     return
 
                 entity_id = new_state.get(ENTITY_ID)
 
-                domain = entity_id.split(".")[0]
+                domain = entity_id.partition(".")[0]
 
                 entity_settings = self._entities[domain].get(entity_id)
 
-                actions = entity_settings.get("keys").values()
+                actions = entity_settings.get(KEYS).values()
 
                 state = new_state.get(const.STATE)
 
                 attributes = new_state.get(const.ATTRIBUTES, {})
 
-                self._entities[domain][entity_id][const.STATE] = state
-                self._entities[domain][entity_id][const.ATTRIBUTES] = attributes
+                entity_settings[const.STATE] = state
+                entity_settings[const.ATTRIBUTES] = attributes
 
                 update_state = {
                     const.STATE: state,
@@ -381,7 +388,7 @@ class HomeAssistantBackend:
         if not entity_id or "." not in entity_id:
             return entity_fallback_dict
 
-        domain = entity_id.split(".")[0]
+        domain = entity_id.partition(".")[0]
 
         entity_dict = self._entities.get(domain, {}).get(entity_id, entity_fallback_dict)
         entity_dict[const.HA_CONNECTED] = self.is_connected()
@@ -417,10 +424,10 @@ class HomeAssistantBackend:
             log.error("Error retrieving domains and entities.")
             return
 
-        for entity in _get_field_from_message(response, "result"):
+        for entity in _get_field_from_message(response, FIELD_RESULT):
             entity_id = entity.get(ENTITY_ID)
 
-            domain = entity_id.split(".")[0]
+            domain = entity_id.partition(".")[0]
 
             if domain not in domains:
                 domains.append(domain)
@@ -429,10 +436,10 @@ class HomeAssistantBackend:
                 entities[domain] = {}
 
             entities[domain][entity_id] = {
-                "state": entity.get("state", "off"),
-                "attributes": entity.get("attributes", {}),
-                "keys": {},
-                "subscription_id": -1,
+                const.STATE: entity.get(const.STATE, "off"),
+                const.ATTRIBUTES: entity.get(const.ATTRIBUTES, {}),
+                KEYS: {},
+                SUBSCRIPTION_ID: -1,
             }
 
         if self._entities:
@@ -440,11 +447,11 @@ class HomeAssistantBackend:
             for domain, domain_entry in self._entities.items():
                 for entity_id in domain_entry.keys():
                     if entities.get(domain, {}).get(entity_id):
-                        entities[domain][entity_id]["keys"] = domain_entry[entity_id].get(
-                            "keys", {})
-                        entities[domain][entity_id]["subscription_id"] = domain_entry[
+                        entities[domain][entity_id][KEYS] = domain_entry[entity_id].get(
+                            KEYS, {})
+                        entities[domain][entity_id][SUBSCRIPTION_ID] = domain_entry[
                             entity_id].get(
-                            "subscription_id", -1)
+                            SUBSCRIPTION_ID, -1)
 
         self._domains = domains
         self._entities = entities
@@ -482,7 +489,7 @@ class HomeAssistantBackend:
         if not self._connect():
             return
 
-        domain = entity_id.split(".")[0]
+        domain = entity_id.partition(".")[0]
 
         message = self._create_message("call_service")
         message["domain"] = domain
@@ -499,7 +506,31 @@ class HomeAssistantBackend:
             success = _get_field_from_message(response, FIELD_SUCCESS)
 
             if not success:
-                log.error(f"Error calling service {service} for entity {entity_id}.")
+                log.error("Error calling service {} for entity {}.", service, entity_id)
+
+    def queue_service_call(self, entity_id: str, service: str, data: Dict[str, Any] = None) -> None:
+        """
+        Calls a Home Assistant service without blocking the caller. Calls are executed one after
+        another in the order they were queued.
+        """
+        self._service_call_queue.put((entity_id, service, data))
+
+        if not self._service_call_thread or not self._service_call_thread.is_alive():
+            self._service_call_thread = Thread(target=self._process_service_calls, daemon=True)
+            self._service_call_thread.start()
+
+    def _process_service_calls(self) -> None:
+        """
+        Execute the queued service calls in order.
+        """
+        while True:
+            entity_id, service, data = self._service_call_queue.get()
+
+            try:
+                self.call_service(entity_id, service, data)
+            except Exception:  # pylint: disable=broad-exception-caught
+                # keep the worker alive for the calls that are still queued
+                log.exception("Error calling service {} for entity {}.", service, entity_id)
 
     def _create_message(self, message_type: str) -> Dict[str, Any]:
         """
@@ -517,7 +548,7 @@ class HomeAssistantBackend:
         if not entity_id or not self._connect():
             return
 
-        domain = entity_id.split(".")[0]
+        domain = entity_id.partition(".")[0]
 
         if not self._entities:
             self._load_domains_and_entities()
@@ -528,7 +559,7 @@ class HomeAssistantBackend:
             # entity doesn't exist (anymore)
             return
 
-        if action_uid in entity_settings.get("keys").keys():
+        if action_uid in entity_settings.get(KEYS).keys():
             # key already registered
             return
 
@@ -537,18 +568,18 @@ class HomeAssistantBackend:
 
         self._tracked_entities[entity_id] = actions
 
-        entity_settings.get("keys")[action_uid] = action_entity_updated
+        entity_settings.get(KEYS)[action_uid] = action_entity_updated
 
-        if entity_settings.get("subscription_id") > -1:
+        if entity_settings.get(SUBSCRIPTION_ID) > -1:
             # already subscribed to entity events
             return
 
         message = self._create_message("subscribe_trigger")
-        message["trigger"] = {"platform": "state", ENTITY_ID: entity_id}
+        message[FIELD_TRIGGER] = {"platform": "state", ENTITY_ID: entity_id}
 
         self._changes_websocket.send(json.dumps(message))
 
-        entity_settings["subscription_id"] = message.get(ID)
+        entity_settings[SUBSCRIPTION_ID] = message.get(ID)
 
     def remove_tracked_entity(self, entity_id: str, action_uid: str) -> None:
         """
@@ -557,21 +588,21 @@ class HomeAssistantBackend:
         if not entity_id or not self._connect():
             return
 
-        domain = entity_id.split(".")[0]
+        domain = entity_id.partition(".")[0]
 
         entity_settings = self._entities[domain].get(entity_id, {})
-        entity_settings.get("keys", {}).pop(action_uid, None)
+        entity_settings.get(KEYS, {}).pop(action_uid, None)
 
-        if len(entity_settings.get("keys", {})) > 0:
+        if len(entity_settings.get(KEYS, {})) > 0:
             # the entity is still attached to another key, so keep the trigger subscription
             return
 
         message = self._create_message("unsubscribe_events")
-        message["subscription_id"] = entity_settings["subscription_id"]
+        message[SUBSCRIPTION_ID] = entity_settings[SUBSCRIPTION_ID]
 
         self._changes_websocket.send(json.dumps(message))
 
-        entity_settings["subscription_id"] = -1
+        entity_settings[SUBSCRIPTION_ID] = -1
 
         self._tracked_entities.pop(entity_id)
 
@@ -603,18 +634,18 @@ class HomeAssistantBackend:
             if connected:
                 self._websocket.send(json.dumps(message))
             else:
-                log.error(f"({e}) Cannot send message {message}")
+                log.error("({}) Cannot send message {}", e, message)
                 return const.EMPTY_STRING
         try:
             return self._websocket.recv()
         except ERRORS_TO_EXCEPT as e:
-            log.error(f"Error: {e}")
+            log.error("Error: {}", e)
             self._reconnect()
 
             if try_count < 3:
                 return self._send_and_wait_for_response(message, try_count + 1)
 
-        log.error(f"Cannot send message {message}")
+        log.error("Cannot send message {}", message)
         return const.EMPTY_STRING
 
     def _keep_alive(self):
@@ -631,7 +662,7 @@ class HomeAssistantBackend:
                 self._websocket.ping()
             except ERRORS_TO_EXCEPT as e:
                 self._connection_status_callback(const.NOT_CONNECTED)
-                log.info(f"Disconnected from Home Assistant: {e}")
+                log.info("Disconnected from Home Assistant: {}", e)
                 return
 
     def _retry_connect(self):
@@ -694,13 +725,18 @@ def _get_field_from_message(message: str, field: str) -> Any:
     """
     Extracts the specified field from the message.
     """
+    return _parse_message(message).get(field, "")
+
+
+def _parse_message(message: str) -> Dict[str, Any]:
+    """
+    Parses the message into a dict. Returns an empty dict if the message cannot be parsed.
+    """
     if not message:
-        return ""
+        return {}
 
     try:
-        parsed = json.loads(message)
-
-        return parsed.get(field, "")
+        return json.loads(message)
     except json.JSONDecodeError:
-        log.error(f"Could not parse {message}")
-        return ""
+        log.error("Could not parse {}", message)
+        return {}
@@ -33,6 +33,7 @@ CONNECT_NOTIFY_ACTIVE = "notify::active"
 CONNECT_NOTIFY_TEXT = "notify::text"
 CONNECT_NOTIFY_COLOR_SET = "color-set"
 CONNECT_NOTIFY_ENABLE_EXPANSION = "notify::enable-expansion"
+CONNECT_MAP = "map"
 
 LABEL_ENTITY_DOMAIN = "actions.home_assistant.entity.domain.label"
 LABEL_ENTITY_ENTITY = "actions.home_assistant.entity.entity.label"
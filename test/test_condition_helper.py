@@ -0,0 +1,52 @@
+import sys
+import unittest
+from pathlib import Path
+
+absolute_plugin_path = str(Path(__file__).parent.parent.parent.absolute())
+
+sys.path.insert(0, absolute_plugin_path)
+
+from de_gensyn_HomeAssistantPlugin.actions.HomeAssistantAction.helper.condition_helper import is_condition_met
+
+
+class TestConditionHelper(unittest.TestCase):
+
+    def test_equality(self):
+        self.assertTrue(is_condition_met("on", "==", "on"))
+        self.assertFalse(is_condition_met("on", "==", "off"))
+        self.assertTrue(is_condition_met("on", "!=", "off"))
+        self.assertFalse(is_condition_met("on", "!=", "on"))
+
+    def test_equality_int_vs_float(self):
+        self.assertTrue(is_condition_met("21", "==", 21.0))
+        self.assertTrue(is_condition_met(21, "==", "21.0"))
+        self.assertFalse(is_condition_met("21", "!=", 21.0))
+
+    def test_numeric_operators(self):
+        self.assertTrue(is_condition_met("5", "<", "10"))
+        self.assertTrue(is_condition_met("10", "<=", "10"))
+        self.assertTrue(is_condition_met(11, ">", "10.5"))
+        self.assertFalse(is_condition_met("5", ">=", "10"))
+
+    def test_numeric_operators_with_non_numeric_input(self):
+        # non-numeric current value
+        self.assertFalse(is_condition_met("on", "<", "10"))
+
+        # non-numeric custom value
+        with self.assertLogs(level="ERROR"):
+            self.assertFalse(is_condition_met("5", ">", "abc"))
+
+    def test_none_custom_value(self):
+        self.assertTrue(is_condition_met("None", "==", None))
+        self.assertTrue(is_condition_met("5", "!=", None))
+
+        with self.assertLogs(level="ERROR"):
+            self.assertFalse(is_condition_met("5", "<", None))
+
+    def test_unknown_operator(self):
+        self.assertFalse(is_condition_met("5", "~", "5"))
+        self.assertFalse(is_condition_met("on", "~", "on"))
+
+
+if __name__ == '__main__':
+    unittest.main()